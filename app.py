@@ -3,12 +3,11 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import numpy as np
-from datetime import datetime, timedelta
-import time
-from currency_api import get_exchange_rates, get_historical_rates
-from time_series_model import forecast_currency
+from datetime import date, datetime, timedelta
+from currency_api import get_exchange_rates, get_historical_rates_multi
+from time_series_model import cached_forecast
 from news_api import get_economic_news
-from utils import calculate_gain_loss, get_currency_list, get_currency_full_names
+from utils import calculate_gain_loss, downsample_lttb, get_currency_list, get_currency_full_names, get_target_currencies
 
 # Page configuration
 st.set_page_config(
@@ -31,44 +30,55 @@ if 'investment_amount' not in st.session_state:
 st.title("Currency Conversion Predictor")
 st.markdown("Analyze forex trends and predict the best time to convert currencies.")
 
+# Currency lookups used across the sidebar and tabs
+currency_list = get_currency_list()
+currency_full_names = get_currency_full_names()
+
 # Sidebar for settings
-with st.sidebar:
+# Widgets live in a form so the app only reruns once the user applies their changes
+with st.sidebar, st.form("settings"):
     st.header("Settings")
     
     # Base currency selection
-    currency_list = get_currency_list()
     base_currency = st.selectbox(
         "Select Base Currency",
         options=currency_list,
         index=currency_list.index(st.session_state.base_currency)
     )
     
-    if base_currency != st.session_state.base_currency:
-        st.session_state.base_currency = base_currency
-        st.session_state.selected_currencies = []
-    
     # Target currencies selection
-    available_currencies = [curr for curr in currency_list if curr != base_currency]
+    available_currencies = get_target_currencies(st.session_state.base_currency)
     selected_currencies = st.multiselect(
         "Select Target Currencies to Track",
         options=available_currencies,
         default=st.session_state.selected_currencies
     )
     
-    st.session_state.selected_currencies = selected_currencies
-    
     # Forecast settings
     st.subheader("Forecast Settings")
-    st.session_state.forecast_days = st.slider("Forecast Days", 7, 90, st.session_state.forecast_days)
+    forecast_days = st.slider("Forecast Days", 7, 90, st.session_state.forecast_days)
     
     # Investment calculator
     st.subheader("Investment Calculator")
-    st.session_state.investment_amount = st.number_input(
-        f"Investment Amount ({base_currency})",
+    investment_amount = st.number_input(
+        f"Investment Amount ({st.session_state.base_currency})",
         min_value=1.0,
         value=st.session_state.investment_amount,
         key="sidebar_investment_amount"
     )
+    
+    if st.form_submit_button("Apply"):
+        base_changed = base_currency != st.session_state.base_currency
+        
+        st.session_state.base_currency = base_currency
+        # A currency can't be tracked against itself
+        st.session_state.selected_currencies = [curr for curr in selected_currencies if curr != base_currency]
+        st.session_state.forecast_days = forecast_days
+        st.session_state.investment_amount = investment_amount
+        
+        # Rerun so the form's options and labels reflect the new base currency
+        if base_changed:
+            st.rerun()
 
 # Main content
 tabs = st.tabs(["Live Rates", "Historical Trends", "Forecasting", "Gain/Loss Calculator", "Economic News"])
@@ -80,45 +90,55 @@ with tabs[0]:
     if not st.session_state.selected_currencies:
         st.warning("Please select at least one target currency in the sidebar.")
     else:
-        with st.spinner("Fetching latest exchange rates..."):
-            rates = get_exchange_rates(st.session_state.base_currency)
-            if rates:
-                # Create a DataFrame for display
-                filtered_rates = {curr: rates[curr] for curr in st.session_state.selected_currencies if curr in rates}
-                df_rates = pd.DataFrame({
-                    'Currency': list(filtered_rates.keys()),
-                    'Currency Name': [get_currency_full_names().get(curr, curr) for curr in filtered_rates.keys()],
-                    'Exchange Rate': list(filtered_rates.values()),
-                    f'Value of {st.session_state.investment_amount} {st.session_state.base_currency}': 
-                        [st.session_state.investment_amount * rate for rate in filtered_rates.values()]
-                })
+        # Read the checkbox state up front since it decides the fragment's refresh interval
+        auto_refresh = st.session_state.get("auto_refresh_rates", False)
+        
+        # The browser triggers the fragment rerun, so the server is never blocked waiting
+        @st.fragment(run_every="60s" if auto_refresh else None)
+        def render_live_rates():
+            with st.spinner("Fetching latest exchange rates..."):
+                rates = get_exchange_rates(st.session_state.base_currency)
+                if rates:
+                    # Build the table as plain columns; st.dataframe accepts a dict directly
+                    filtered_rates = {curr: rates[curr] for curr in st.session_state.selected_currencies if curr in rates}
+                    currencies = list(filtered_rates.keys())
+                    currency_names = [currency_full_names.get(curr, curr) for curr in currencies]
+                    exchange_rates = np.fromiter(filtered_rates.values(), dtype=np.float64, count=len(filtered_rates))
+                    rates_table = {
+                        'Currency': currencies,
+                        'Currency Name': currency_names,
+                        'Exchange Rate': exchange_rates,
+                        f'Value of {st.session_state.investment_amount} {st.session_state.base_currency}': 
+                            st.session_state.investment_amount * exchange_rates
+                    }
                 
-                st.dataframe(df_rates, use_container_width=True)
+                    st.dataframe(rates_table, use_container_width=True)
                 
-                # Create bar chart for comparison
-                fig = px.bar(
-                    df_rates, 
-                    x='Currency', 
-                    y='Exchange Rate',
-                    title=f"Current Exchange Rates (Base: {st.session_state.base_currency})",
-                    color='Currency',
-                    hover_data=['Currency Name']
-                )
-                st.plotly_chart(fig, use_container_width=True)
-            else:
-                st.error("Failed to fetch exchange rates. Please try again later.")
+                    # Create bar chart for comparison
+                    palette = px.colors.qualitative.Plotly
+                    fig = go.Figure(go.Bar(
+                        x=currencies,
+                        y=exchange_rates,
+                        customdata=currency_names,
+                        marker_color=[palette[i % len(palette)] for i in range(len(currencies))],
+                        hovertemplate="Currency=%{x}<br>Exchange Rate=%{y}<br>Currency Name=%{customdata}<extra></extra>"
+                    ))
+                    fig.update_layout(
+                        title=f"Current Exchange Rates (Base: {st.session_state.base_currency})",
+                        xaxis_title="Currency",
+                        yaxis_title="Exchange Rate"
+                    )
+                    # A stable key lets the browser update the existing chart in place
+                    st.plotly_chart(fig, use_container_width=True, key="live_rates_chart")
+                else:
+                    st.error("Failed to fetch exchange rates. Please try again later.")
                 
+        render_live_rates()
+        
         # Auto-refresh option
-        auto_refresh = st.checkbox("Auto-refresh rates (every 60 seconds)")
+        st.checkbox("Auto-refresh rates (every 60 seconds)", key="auto_refresh_rates")
         if auto_refresh:
             st.info("Rates will refresh automatically every 60 seconds")
-            # Add a placeholder for the auto-refresh time indicator
-            refresh_placeholder = st.empty()
-            # Wait for 60 seconds before rerunning
-            for i in range(60, 0, -1):
-                refresh_placeholder.text(f"Refreshing in {i} seconds...")
-                time.sleep(1)
-            st.rerun()
 
 # Tab 2: Historical Trends
 with tabs[1]:
@@ -147,16 +167,18 @@ with tabs[1]:
             st.error("Start date must be before end date")
         else:
             with st.spinner("Fetching historical data..."):
-                historical_data = {}
-                for currency in st.session_state.selected_currencies:
-                    historical_rates = get_historical_rates(
-                        st.session_state.base_currency,
-                        currency,
-                        start_date.strftime('%Y-%m-%d'),
-                        end_date.strftime('%Y-%m-%d')
-                    )
-                    if historical_rates:
-                        historical_data[currency] = historical_rates
+                # A single fetch serves every selected currency
+                multi_rates = get_historical_rates_multi(
+                    st.session_state.base_currency,
+                    st.session_state.selected_currencies,
+                    start_date.strftime('%Y-%m-%d'),
+                    end_date.strftime('%Y-%m-%d')
+                )
+                historical_data = {
+                    currency: multi_rates[currency]
+                    for currency in st.session_state.selected_currencies
+                    if multi_rates.get(currency)
+                }
                 
                 if not historical_data:
                     st.error("Failed to fetch historical data. Please try again later.")
@@ -165,12 +187,15 @@ with tabs[1]:
                     fig = go.Figure()
                     
                     for currency, rates in historical_data.items():
-                        dates = list(rates.keys())
-                        values = list(rates.values())
+                        dates = np.array(list(rates.keys()), dtype='datetime64[D]')
+                        values = np.fromiter(rates.values(), dtype=np.float64, count=len(rates))
                         
-                        fig.add_trace(go.Scatter(
-                            x=dates,
-                            y=values,
+                        # Cap the points sent to the browser for wide date ranges
+                        idx = downsample_lttb(dates.astype(np.int64), values, n_out=500)
+                        
+                        fig.add_trace(go.Scattergl(
+                            x=dates[idx],
+                            y=values[idx],
                             mode='lines',
                             name=f"{st.session_state.base_currency}/{currency}"
                         ))
@@ -189,17 +214,18 @@ with tabs[1]:
                     st.subheader("Statistical Insights")
                     
                     for currency, rates in historical_data.items():
-                        rates_values = list(rates.values())
+                        rates_values = np.fromiter(rates.values(), dtype=np.float64, count=len(rates))
+                        mean_rate = rates_values.mean()
+                        volatility = rates_values.std() / mean_rate * 100
                         
                         col1, col2, col3, col4 = st.columns(4)
                         with col1:
-                            st.metric(f"{currency} - Average", f"{np.mean(rates_values):.4f}")
+                            st.metric(f"{currency} - Average", f"{mean_rate:.4f}")
                         with col2:
-                            st.metric(f"{currency} - Min", f"{min(rates_values):.4f}")
+                            st.metric(f"{currency} - Min", f"{rates_values.min():.4f}")
                         with col3:
-                            st.metric(f"{currency} - Max", f"{max(rates_values):.4f}")
+                            st.metric(f"{currency} - Max", f"{rates_values.max():.4f}")
                         with col4:
-                            volatility = np.std(rates_values) / np.mean(rates_values) * 100
                             st.metric(f"{currency} - Volatility", f"{volatility:.2f}%")
 
 # Tab 3: Forecasting
@@ -221,33 +247,43 @@ with tabs[2]:
             st.warning("Please select at least one currency to forecast.")
         else:
             with st.spinner("Generating forecasts..."):
+                # Use the same calendar-day window for every currency so a single
+                # cached fetch serves all of their training data
+                today = date.today()
+                training_rates = get_historical_rates_multi(
+                    st.session_state.base_currency,
+                    forecast_currency_options,
+                    (today - timedelta(days=365)).strftime('%Y-%m-%d'),
+                    today.strftime('%Y-%m-%d')
+                )
+                
                 for currency in forecast_currency_options:
                     st.subheader(f"{st.session_state.base_currency}/{currency} Forecast")
                     
-                    # Get historical data for training
-                    historical_rates = get_historical_rates(
-                        st.session_state.base_currency,
-                        currency,
-                        (datetime.now().date() - timedelta(days=365)).strftime('%Y-%m-%d'),
-                        datetime.now().date().strftime('%Y-%m-%d')
-                    )
+                    historical_rates = training_rates.get(currency)
                     
                     if historical_rates:
-                        # Prepare data for forecasting
+                        # Prepare historical data for plotting
                         df_historical = pd.DataFrame({
                             'ds': pd.to_datetime(list(historical_rates.keys())),
                             'y': list(historical_rates.values())
                         })
                         
                         # Generate forecast
-                        forecast_df = forecast_currency(df_historical, st.session_state.forecast_days)
+                        forecast_df = cached_forecast(
+                            st.session_state.base_currency,
+                            currency,
+                            st.session_state.forecast_days,
+                            today.strftime('%Y-%m-%d'),
+                            tuple(historical_rates.items())
+                        )
                         
                         if forecast_df is not None:
                             # Plot the forecast
                             fig = go.Figure()
                             
                             # Historical data
-                            fig.add_trace(go.Scatter(
+                            fig.add_trace(go.Scattergl(
                                 x=df_historical['ds'],
                                 y=df_historical['y'],
                                 mode='lines',
@@ -256,7 +292,7 @@ with tabs[2]:
                             ))
                             
                             # Forecast
-                            fig.add_trace(go.Scatter(
+                            fig.add_trace(go.Scattergl(
                                 x=forecast_df['ds'],
                                 y=forecast_df['yhat'],
                                 mode='lines',
@@ -265,7 +301,7 @@ with tabs[2]:
                             ))
                             
                             # Upper and lower bounds
-                            fig.add_trace(go.Scatter(
+                            fig.add_trace(go.Scattergl(
                                 x=forecast_df['ds'],
                                 y=forecast_df['yhat_upper'],
                                 mode='lines',
@@ -273,7 +309,7 @@ with tabs[2]:
                                 showlegend=False
                             ))
                             
-                            fig.add_trace(go.Scatter(
+                            fig.add_trace(go.Scattergl(
                                 x=forecast_df['ds'],
                                 y=forecast_df['yhat_lower'],
                                 mode='lines',
@@ -293,8 +329,8 @@ with tabs[2]:
                             st.plotly_chart(fig, use_container_width=True)
                             
                             # Forecast insights
-                            current_rate = list(historical_rates.values())[-1]
-                            future_rate = forecast_df['yhat'].iloc[-1]
+                            current_rate = next(reversed(historical_rates.values()))
+                            future_rate = forecast_df['yhat'].iat[-1]
                             percent_change = (future_rate - current_rate) / current_rate * 100
                             
                             col1, col2 = st.columns(2)
@@ -434,10 +470,10 @@ with tabs[4]:
             
             if news_items:
                 for i, news in enumerate(news_items):
-                    with st.expander(f"{news['title']} ({news['source']})", expanded=i==0):
-                        st.write(f"**Published:** {news['publishedAt']}")
-                        st.write(news['description'])
-                        st.markdown(f"[Read more]({news['url']})")
+                    with st.expander(f"{news.title} ({news.source})", expanded=i==0):
+                        st.write(f"**Published:** {news.publishedAt}")
+                        st.write(news.description)
+                        st.markdown(f"[Read more]({news.url})")
             else:
                 st.warning("No relevant economic news found. Please try again later.")
 
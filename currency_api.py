@@ -1,17 +1,81 @@
 import requests
+from requests.adapters import HTTPAdapter
+import numpy as np
 import pandas as pd
+import streamlit as st
+from diskcache import Cache
+from scipy.signal import lfilter
 from datetime import datetime, timedelta
 import os
 import json
+import logging
 import time
 
-# Cache for exchange rates to reduce API calls
-exchange_rate_cache = {}
-historical_rate_cache = {}
+logger = logging.getLogger(__name__)
 
 # API endpoints
 EXCHANGE_RATE_API = "https://api.exchangerate-api.com/v4/latest/"
 HISTORICAL_API = "https://api.exchangerate-api.com/v4/history/"
+REQUEST_TIMEOUT = 5  # seconds
+
+# Persistent cache location and expiry times (in seconds)
+CACHE_DIR = os.path.join(".cache", "currency")
+EXCHANGE_RATE_CACHE_TTL = 3600  # 1 hour
+HISTORICAL_RATE_CACHE_TTL = 86400  # 1 day
+
+@st.cache_resource
+def _get_session():
+    """
+    Get the HTTP session shared by all API calls.
+    
+    Reusing one session keeps connections alive between requests instead of
+    paying for a new TCP/TLS handshake on every call.
+    
+    Returns:
+        requests.Session: The shared session
+    """
+    session = requests.Session()
+    # Keep enough pooled connections for concurrent fetches from multiple sessions
+    session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=16))
+    return session
+
+@st.cache_resource
+def _get_disk_cache():
+    """
+    Get the on-disk cache shared by all sessions.
+    
+    Unlike st.cache_data, it survives app restarts and is safe to share
+    between processes.
+    
+    Returns:
+        diskcache.Cache: The shared cache
+    """
+    return Cache(CACHE_DIR)
+
+@st.cache_data(ttl=EXCHANGE_RATE_CACHE_TTL, show_spinner=False)
+def _fetch_exchange_rates(base_currency):
+    """
+    Fetch current exchange rates for a base currency, cached for 1 hour.
+    
+    Raises on failure so that failed requests are not cached.
+    
+    Args:
+        base_currency (str): The base currency code (e.g., USD, EUR)
+        
+    Returns:
+        dict: Dictionary of exchange rates
+    """
+    cache_key = ("exchange_rates", base_currency)
+    rates = _get_disk_cache().get(cache_key)
+    if rates is not None:
+        return rates
+    
+    response = _get_session().get(f"{EXCHANGE_RATE_API}{base_currency}", timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    data = response.json()
+    rates = data.get('rates', {})
+    _get_disk_cache().set(cache_key, rates, expire=EXCHANGE_RATE_CACHE_TTL)
+    return rates
 
 def get_exchange_rates(base_currency):
     """
@@ -23,24 +87,13 @@ def get_exchange_rates(base_currency):
     Returns:
         dict: Dictionary of exchange rates or None if request fails
     """
-    # Check cache first (cache expires after 1 hour)
-    cache_key = f"{base_currency}_{datetime.now().strftime('%Y-%m-%d_%H')}"
-    if cache_key in exchange_rate_cache:
-        return exchange_rate_cache[cache_key]
-    
     try:
-        response = requests.get(f"{EXCHANGE_RATE_API}{base_currency}")
-        if response.status_code == 200:
-            data = response.json()
-            rates = data.get('rates', {})
-            # Cache the result
-            exchange_rate_cache[cache_key] = rates
-            return rates
-        else:
-            print(f"Error fetching exchange rates: {response.status_code}")
-            return None
-    except Exception as e:
-        print(f"Exception in get_exchange_rates: {e}")
+        return _fetch_exchange_rates(base_currency)
+    except requests.HTTPError as e:
+        logger.warning("Error fetching exchange rates: %s", e.response.status_code)
+        return None
+    except (requests.RequestException, ValueError) as e:
+        logger.warning("Exception in get_exchange_rates: %s", e)
         return None
 
 def get_historical_rates(base_currency, target_currency, start_date, end_date):
@@ -56,10 +109,79 @@ def get_historical_rates(base_currency, target_currency, start_date, end_date):
     Returns:
         dict: Dictionary mapping dates to rates or None if request fails
     """
-    # Check cache first
-    cache_key = f"{base_currency}_{target_currency}_{start_date}_{end_date}"
-    if cache_key in historical_rate_cache:
-        return historical_rate_cache[cache_key]
+    historical_rates = get_historical_rates_multi(base_currency, [target_currency], start_date, end_date)
+    return historical_rates.get(target_currency)
+
+def get_single_rate(base_currency, target_currency, date_str):
+    """
+    Fetch the exchange rate between two currencies on a single date.
+    
+    Args:
+        base_currency (str): The base currency code
+        target_currency (str): The target currency code
+        date_str (str): Date in YYYY-MM-DD format
+        
+    Returns:
+        float: The exchange rate on that date or None if not available
+    """
+    historical_rates = get_historical_rates(base_currency, target_currency, date_str, date_str)
+    if not historical_rates:
+        return None
+    return historical_rates.get(date_str)
+
+def get_historical_rates_multi(base_currency, target_currencies, start_date, end_date):
+    """
+    Fetch historical exchange rates for several target currencies at once.
+    
+    The history API returns rates for every currency on each date, so all
+    targets are served from a single request per date chunk.
+    
+    Args:
+        base_currency (str): The base currency code
+        target_currencies (list): List of target currency codes
+        start_date (str): Start date in YYYY-MM-DD format
+        end_date (str): End date in YYYY-MM-DD format
+        
+    Returns:
+        dict: Dictionary mapping each target currency to a dict of dates to rates
+    """
+    target_currencies = sorted(set(target_currencies))
+    try:
+        # The cache holds every currency, so any set of targets reuses the same fetch
+        all_rates = _fetch_historical_rates(base_currency, start_date, end_date)
+        return {target: all_rates.get(target, {}) for target in target_currencies}
+    except requests.HTTPError as e:
+        logger.warning("Error fetching historical rates: %s", e.response.status_code)
+    except (requests.RequestException, ValueError, KeyError) as e:
+        logger.warning("Exception in get_historical_rates: %s", e)
+    
+    # Fallback to simulated data for demo purposes if API fails; this happens
+    # outside the cached fetch so a transient failure is not cached
+    logger.warning("Using simulated historical data")
+    return {
+        target: simulate_historical_data(base_currency, target, start_date, end_date)
+        for target in target_currencies
+    }
+
+@st.cache_data(ttl=HISTORICAL_RATE_CACHE_TTL, show_spinner=False)
+def _fetch_historical_rates(base_currency, start_date, end_date):
+    """
+    Fetch historical exchange rates for every currency the API returns, cached for 1 day.
+    
+    Raises on failure so that failed requests are not cached.
+    
+    Args:
+        base_currency (str): The base currency code
+        start_date (str): Start date in YYYY-MM-DD format
+        end_date (str): End date in YYYY-MM-DD format
+        
+    Returns:
+        dict: Dictionary mapping each currency to a dict of dates to rates
+    """
+    cache_key = ("historical_rates", base_currency, start_date, end_date)
+    result = _get_disk_cache().get(cache_key)
+    if result is not None:
+        return result
     
     # Convert dates to datetime objects
     start_dt = datetime.strptime(start_date, '%Y-%m-%d')
@@ -75,47 +197,34 @@ def get_historical_rates(base_currency, target_currency, start_date, end_date):
         chunk_start = current_start.strftime('%Y-%m-%d')
         chunk_end = current_end.strftime('%Y-%m-%d')
         
-        try:
-            # Use simplified approach for demo
-            # In real-world, you would use a more comprehensive API
-            url = f"{HISTORICAL_API}{base_currency}?start_date={chunk_start}&end_date={chunk_end}"
-            response = requests.get(url)
-            
-            if response.status_code == 200:
-                data = response.json()
-                rates_data = data.get('rates', {})
-                
-                # Extract rates for each date
-                for date_str, rates in rates_data.items():
-                    if target_currency in rates:
-                        result[date_str] = rates[target_currency]
-            else:
-                print(f"Error fetching historical rates: {response.status_code}")
-                
-                # Fallback to simulated data for demo purposes if API fails
-                print("Using simulated historical data")
-                result = simulate_historical_data(base_currency, target_currency, start_date, end_date)
-                break
-                
-            # Avoid rate limiting
+        # Use simplified approach for demo
+        # In real-world, you would use a more comprehensive API
+        url = f"{HISTORICAL_API}{base_currency}?start_date={chunk_start}&end_date={chunk_end}"
+        response = _get_session().get(url, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        data = response.json()
+        rates_data = data.get('rates', {})
+        
+        # Regroup the per-date rates by currency
+        for date_str, rates in rates_data.items():
+            for currency, rate in rates.items():
+                result.setdefault(currency, {})[date_str] = rate
+        
+        # Move to next chunk
+        current_start = current_end + timedelta(days=1)
+        
+        # Avoid rate limiting, but only if another request will follow
+        if current_start <= end_dt:
             time.sleep(1)
-            
-            # Move to next chunk
-            current_start = current_end + timedelta(days=1)
-            
-        except Exception as e:
-            print(f"Exception in get_historical_rates: {e}")
-            
-            # Fallback to simulated data for demo purposes
-            print("Using simulated historical data")
-            result = simulate_historical_data(base_currency, target_currency, start_date, end_date)
-            break
-    
-    # Sort by date
-    result = {k: result[k] for k in sorted(result.keys())}
-    
-    # Cache the result
-    historical_rate_cache[cache_key] = result
+    
+    # Sort by date; YYYY-MM-DD keys sort chronologically as strings, and the
+    # API usually returns them in order already, so only rebuild when needed
+    for target, rates in result.items():
+        dates = list(rates)
+        if any(a > b for a, b in zip(dates, dates[1:])):
+            result[target] = dict(sorted(rates.items()))
+    
+    _get_disk_cache().set(cache_key, result, expire=HISTORICAL_RATE_CACHE_TTL)
     
     return result
 
@@ -141,35 +250,38 @@ def simulate_historical_data(base_currency, target_currency, start_date, end_dat
     else:
         base_rate = current_rates[target_currency]
     
-    # Generate dates
-    start_dt = datetime.strptime(start_date, '%Y-%m-%d')
-    end_dt = datetime.strptime(end_date, '%Y-%m-%d')
-    
-    # Generate simulated rates
-    result = {}
-    current_date = start_dt
+    # Generate all date strings up front
+    date_strs = pd.date_range(start_date, end_date, freq='D').strftime('%Y-%m-%d').tolist()
     
     # Use a simple random walk with mean reversion for simulation
-    import numpy as np
-    np.random.seed(int(base_rate * 1000))  # Use base_rate for seed to get consistent results
+    rates = _vectorized_walk(base_rate, len(date_strs))
     
-    volatility = 0.005  # Daily volatility
-    mean_reversion = 0.05  # Mean reversion strength
-    
-    rate = base_rate * (0.9 + 0.2 * np.random.random())  # Start with variation around base_rate
+    return dict(zip(date_strs, rates.tolist()))
+
+def _vectorized_walk(base_rate, n, volatility=0.005, mean_reversion=0.05):
+    """
+    Generate a mean-reverting random walk of exchange rates.
     
-    while current_date <= end_dt:
-        date_str = current_date.strftime('%Y-%m-%d')
-        
-        # Apply random walk with mean reversion
-        random_change = np.random.normal(0, volatility)
-        mean_reversion_effect = mean_reversion * (base_rate - rate)
-        rate = rate * (1 + random_change + mean_reversion_effect)
+    Args:
+        base_rate (float): The rate the walk reverts towards
+        n (int): Number of daily rates to generate
+        volatility (float): Daily volatility
+        mean_reversion (float): Mean reversion strength
         
-        result[date_str] = rate
-        current_date += timedelta(days=1)
+    Returns:
+        np.ndarray: Array of simulated rates
+    """
+    rng = np.random.default_rng(int(base_rate * 1000))  # Use base_rate for seed to get consistent results
     
-    return result
+    start_rate = base_rate * (0.9 + 0.2 * rng.random())  # Start with variation around base_rate
+    
+    # In log space the walk is an AR(1) process around log(base_rate):
+    #   dev[t] = (1 - mean_reversion) * dev[t-1] + shock[t]
+    # which lfilter evaluates in a single C loop
+    shocks = rng.normal(0, volatility, n)
+    initial_state = [(1 - mean_reversion) * np.log(start_rate / base_rate)]
+    deviations, _ = lfilter([1], [1, mean_reversion - 1], shocks, zi=initial_state)
+    return base_rate * np.exp(deviations)
 
 def get_default_rate(base_currency, target_currency):
     """
@@ -1,109 +1,413 @@
-import requests
+import httpx
+import orjson
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import NamedTuple
+import importlib.util
+import logging
 import os
+import threading
 import time
 
-# Cache for news to reduce API calls
-news_cache = {}
+logger = logging.getLogger(__name__)
+
+# Cache for news to reduce API calls; bounded so old queries are evicted
 NEWS_CACHE_TTL = 3600  # 1 hour in seconds
+NEWS_CACHE_SOFT_TTL = 1800  # refresh in the background after 30 minutes
+NEWS_CACHE_MAXSIZE = 256
+news_cache = TTLCache(maxsize=NEWS_CACHE_MAXSIZE, ttl=NEWS_CACHE_TTL)
+# TTLCache is not thread-safe, and batch fetches and refreshes run in worker threads
+_news_cache_lock = threading.Lock()
+_refresh_executor = ThreadPoolExecutor(max_workers=2)
+# Events for cache misses currently being fetched, so concurrent misses share one request
+_inflight_fetches = {}
 
 # Default API key for NewsAPI
 NEWS_API_KEY = os.getenv("NEWS_API_KEY", "")
 NEWS_API_URL = "https://newsapi.org/v2/everything"
+NEWS_API_TIMEOUT = httpx.Timeout(10.0, connect=3.0)  # seconds
+NEWS_API_RETRIES = 3
+NEWS_API_RETRY_STATUSES = (500, 502, 503, 504)
+NEWS_API_BACKOFF_FACTOR = 0.3  # seconds
+NEWS_API_PAGE_SIZE = 100  # NewsAPI's maximum page size
+
+# Search terms for each currency; currencies not listed search by their code
+CURRENCY_SEARCH_TERMS = {
+    "USD": ("USD", "US Dollar", "Dollar"),
+    "EUR": ("EUR", "Euro", "Eurozone"),
+    "GBP": ("GBP", "British Pound", "Sterling"),
+    "JPY": ("JPY", "Japanese Yen", "Yen"),
+    "CAD": ("CAD", "Canadian Dollar"),
+    "AUD": ("AUD", "Australian Dollar"),
+    "INR": ("INR", "Indian Rupee", "Rupee"),
+    "HUF": ("HUF", "Hungarian Forint", "Forint"),
+}
+
+# Economic terms every news query is restricted to
+ECONOMIC_TERMS = ("economy", "inflation", "interest rate", "central bank", "forex",
+                  "exchange rate", "currency", "economic", "finance", "monetary policy")
+ECONOMIC_QUERY = " OR ".join(ECONOMIC_TERMS)
+
+# General mock news, dated relative to today by day_offset
+MOCK_NEWS = (
+    {
+        'title': 'Central Banks Signal Potential Interest Rate Changes',
+        'description': 'Central banks across major economies are signaling possible changes to interest rates in response to inflation trends, potentially affecting currency markets.',
+        'url': 'https://example.com/economic-news/1',
+        'day_offset': 0,
+        'source': 'Economic Times'
+    },
+    {
+        'title': 'Global Inflation Concerns Impact Currency Markets',
+        'description': 'Rising inflation in major economies is causing volatility in forex markets as investors reassess currency valuations and central bank responses.',
+        'url': 'https://example.com/economic-news/2',
+        'day_offset': 1,
+        'source': 'Financial Post'
+    },
+    {
+        'title': 'Trade Balance Data Shows Shifts in Economic Recovery',
+        'description': 'Recent trade balance figures indicate changing patterns in global economic recovery, with potential implications for currency strength in coming months.',
+        'url': 'https://example.com/economic-news/3',
+        'day_offset': 2,
+        'source': 'World Economic Forum'
+    },
+    {
+        'title': 'Supply Chain Issues Continue to Affect Global Markets',
+        'description': 'Ongoing supply chain disruptions are impacting economic outlooks across regions, creating uncertainty in currency markets and trade relationships.',
+        'url': 'https://example.com/economic-news/4',
+        'day_offset': 3,
+        'source': 'Business Insider'
+    },
+    {
+        'title': 'Economic Growth Forecasts Revised for Major Economies',
+        'description': 'International organizations have updated growth projections for key economies, potentially signaling shifts in relative currency strengths.',
+        'url': 'https://example.com/economic-news/5',
+        'day_offset': 4,
+        'source': 'Reuters'
+    },
+)
+
+# Currency-specific mock news, dated relative to today by day_offset
+MOCK_NEWS_BY_CURRENCY = {
+    "USD": {
+        'title': 'US Dollar Strength Continues Amid Economic Data',
+        'description': 'The US Dollar maintains its position as economic indicators suggest resilience in the American economy despite global challenges.',
+        'url': 'https://example.com/economic-news/usd',
+        'day_offset': 1,
+        'source': 'Wall Street Journal'
+    },
+    "EUR": {
+        'title': 'European Central Bank Discusses Monetary Policy Direction',
+        'description': 'ECB officials are evaluating the economic outlook for the Eurozone and considering adjustments to monetary policy that could impact the Euro.',
+        'url': 'https://example.com/economic-news/eur',
+        'day_offset': 2,
+        'source': 'Financial Times'
+    },
+    "GBP": {
+        'title': 'Bank of England Responds to Inflation Pressures',
+        'description': 'The Bank of England is implementing measures to address rising inflation, with potential implications for the British Pound in international markets.',
+        'url': 'https://example.com/economic-news/gbp',
+        'day_offset': 0,
+        'source': 'The Guardian'
+    },
+    "JPY": {
+        'title': 'Bank of Japan Maintains Policy as Economy Shows Signs of Recovery',
+        'description': 'The Bank of Japan has decided to maintain its current monetary policy stance as economic indicators suggest a gradual recovery, influencing the Yen\'s position.',
+        'url': 'https://example.com/economic-news/jpy',
+        'day_offset': 3,
+        'source': 'Nikkei Asia'
+    },
+    "INR": {
+        'title': 'Indian Rupee Performance Linked to Economic Reforms',
+        'description': 'Recent economic reforms and policy decisions in India are influencing the performance of the Rupee against major global currencies.',
+        'url': 'https://example.com/economic-news/inr',
+        'day_offset': 2,
+        'source': 'Economic Times India'
+    },
+    "HUF": {
+        'title': 'Hungarian Forint Responds to Central Bank Monetary Decisions',
+        'description': 'The Hungarian National Bank\'s recent monetary policy decisions are affecting the Forint\'s exchange rate against major currencies.',
+        'url': 'https://example.com/economic-news/huf',
+        'day_offset': 1,
+        'source': 'Budapest Business Journal'
+    },
+}
+
+MOCK_NEWS_MAX_DAY_OFFSET = max(
+    article['day_offset'] for article in (*MOCK_NEWS, *MOCK_NEWS_BY_CURRENCY.values())
+)
+
+class Article(NamedTuple):
+    """
+    A news article as shown in the news tab.
+    """
+    title: str
+    description: str
+    url: str
+    publishedAt: str
+    source: str
+    
+    def to_dict(self):
+        """
+        Convert the article to a dictionary.
+        
+        Returns:
+            dict: Article fields keyed by name
+        """
+        return self._asdict()
+
+# Returned by _fetch_news when a conditional request finds the cached copy current
+NOT_MODIFIED = object()
+
+# HTTP/2 needs the h2 package; without it, fall back to HTTP/1.1 instead of failing at import
+NEWS_API_HTTP2 = importlib.util.find_spec("h2") is not None
+if not NEWS_API_HTTP2:
+    logger.warning("h2 is not installed; fetching news over HTTP/1.1")
+
+# Shared HTTP/2 client so pages and concurrent refreshes multiplex over one pooled connection;
+# the transport retries failed connection attempts
+_CLIENT = httpx.Client(
+    headers={"User-Agent": "CurrencyIntelligence/1.0"},
+    timeout=NEWS_API_TIMEOUT,
+    transport=httpx.HTTPTransport(
+        http2=NEWS_API_HTTP2,
+        limits=httpx.Limits(max_keepalive_connections=10),
+        retries=NEWS_API_RETRIES
+    )
+)
+
+@lru_cache(maxsize=64)
+def _build_query(currencies):
+    """
+    Build the NewsAPI search query for a set of currencies.
+    
+    Args:
+        currencies (frozenset): Set of currency codes
+        
+    Returns:
+        str: Query in the form "(USD OR Dollar OR ...) AND (economy OR inflation OR ...)"
+    """
+    # Sort so the same set always produces the same query string
+    search_terms = [term for currency in sorted(currencies) for term in CURRENCY_SEARCH_TERMS.get(currency, (currency,))]
+    currency_query = " OR ".join(search_terms)
+    return f"({currency_query}) AND ({ECONOMIC_QUERY})"
+
+@lru_cache(maxsize=64)
+def _build_request_url(currencies, date_from, page_size):
+    """
+    Build the encoded NewsAPI request URL, without the page number.
+    
+    Args:
+        currencies (frozenset): Set of currency codes
+        date_from (str): Oldest article date in YYYY-MM-DD format
+        page_size (int): Number of articles per page
+        
+    Returns:
+        str: Request URL with all query parameters encoded
+    """
+    params = {
+        'q': _build_query(currencies),
+        'from': date_from,
+        'sortBy': 'publishedAt',
+        'language': 'en',
+        'pageSize': page_size,
+        'apiKey': NEWS_API_KEY
+    }
+    return str(httpx.URL(NEWS_API_URL, params=params))
+
+def _get_with_retry(url, headers=None):
+    """
+    Send a GET request, retrying transient server errors with backoff.
+    
+    Args:
+        url (str): Request URL
+        headers (dict): Extra request headers, if any
+        
+    Returns:
+        httpx.Response: The last response received
+    """
+    for attempt in range(NEWS_API_RETRIES + 1):
+        response = _CLIENT.get(url, headers=headers)
+        if response.status_code not in NEWS_API_RETRY_STATUSES or attempt == NEWS_API_RETRIES:
+            return response
+        time.sleep(NEWS_API_BACKOFF_FACTOR * 2 ** attempt)
 
 def get_economic_news(currencies, max_articles=10):
     """
     Fetch economic news related to specified currencies.
     
+    Cached news older than NEWS_CACHE_SOFT_TTL is still returned immediately,
+    while a background thread fetches a fresh copy for later calls.
+    
     Args:
         currencies (list): List of currency codes to get news for
         max_articles (int): Maximum number of articles to return
         
     Returns:
-        list: List of news articles or empty list if request fails
-    """
-    # Check cache first
-    cache_key = f"news_{'_'.join(sorted(currencies))}_{datetime.now().strftime('%Y-%m-%d_%H')}"
-    if cache_key in news_cache and (time.time() - news_cache[cache_key]['timestamp'] < NEWS_CACHE_TTL):
-        return news_cache[cache_key]['data']
-    
-    # Build search query
-    search_terms = []
-    for currency in currencies:
-        # Add currency code and common names
-        if currency == "USD":
-            search_terms.extend(["USD", "US Dollar", "Dollar"])
-        elif currency == "EUR":
-            search_terms.extend(["EUR", "Euro", "Eurozone"])
-        elif currency == "GBP":
-            search_terms.extend(["GBP", "British Pound", "Sterling"])
-        elif currency == "JPY":
-            search_terms.extend(["JPY", "Japanese Yen", "Yen"])
-        elif currency == "CAD":
-            search_terms.extend(["CAD", "Canadian Dollar"])
-        elif currency == "AUD":
-            search_terms.extend(["AUD", "Australian Dollar"])
-        elif currency == "INR":
-            search_terms.extend(["INR", "Indian Rupee", "Rupee"])
-        elif currency == "HUF":
-            search_terms.extend(["HUF", "Hungarian Forint", "Forint"])
+        list: List of Article tuples or empty list if request fails
+    """
+    # Check cache first; the TTL cache drops entries once they are too old to serve,
+    # so the key needs no time bucket
+    cache_key = (frozenset(currencies), max_articles)
+    with _news_cache_lock:
+        entry = news_cache.get(cache_key)
+        if entry is not None:
+            # Only one refresh per entry at a time
+            if time.time() - entry['timestamp'] >= NEWS_CACHE_SOFT_TTL and not entry['refreshing']:
+                entry['refreshing'] = True
+                _refresh_executor.submit(_refresh_news, cache_key, currencies, max_articles, entry['etag'])
+            return entry['data']
+        
+        # On a miss, only the first caller fetches; concurrent callers wait for it
+        inflight = _inflight_fetches.get(cache_key)
+        if inflight is None:
+            inflight = _inflight_fetches[cache_key] = threading.Event()
+            is_leader = True
         else:
-            search_terms.append(currency)
+            is_leader = False
     
-    # Add economic terms
-    economic_terms = ["economy", "inflation", "interest rate", "central bank", "forex", 
-                      "exchange rate", "currency", "economic", "finance", "monetary policy"]
+    if not is_leader:
+        inflight.wait()
+        with _news_cache_lock:
+            entry = news_cache.get(cache_key)
+        if entry is None:
+            # The leading fetch failed
+            return use_mock_news(currencies, max_articles)
+        return entry['data']
     
-    # Build query for NewsAPI
-    # Format: "(USD OR Dollar OR ...) AND (economy OR inflation OR ...)"
-    currency_query = " OR ".join(search_terms)
-    economic_query = " OR ".join(economic_terms)
-    query = f"({currency_query}) AND ({economic_query})"
+    try:
+        results, etag = _fetch_news(currencies, max_articles)
+        if results is not None:
+            # Cache the results
+            with _news_cache_lock:
+                news_cache[cache_key] = {'data': results, 'etag': etag, 'timestamp': time.time(), 'refreshing': False}
+    finally:
+        with _news_cache_lock:
+            del _inflight_fetches[cache_key]
+        inflight.set()
+    
+    if results is None:
+        return use_mock_news(currencies, max_articles)
     
+    return results
+
+def _refresh_news(cache_key, currencies, max_articles, etag=None):
+    """
+    Refresh a stale news cache entry in the background.
+    
+    Args:
+        cache_key (tuple): Key of the cache entry to refresh
+        currencies (list): List of currency codes to get news for
+        max_articles (int): Maximum number of articles to return
+        etag (str): ETag of the cached response, if any
+    """
+    try:
+        results, etag = _fetch_news(currencies, max_articles, etag)
+    except Exception:
+        # Already logged by _fetch_news; keep serving the stale entry
+        results = None
+    with _news_cache_lock:
+        entry = news_cache.get(cache_key)
+        if results is NOT_MODIFIED and entry is not None:
+            # The cached articles are still current; re-insert to restart the TTL
+            news_cache[cache_key] = {**entry, 'timestamp': time.time(), 'refreshing': False}
+        elif results is not None and results is not NOT_MODIFIED:
+            news_cache[cache_key] = {'data': results, 'etag': etag, 'timestamp': time.time(), 'refreshing': False}
+        elif entry is not None:
+            # Keep serving the stale entry and let a later call retry
+            entry['refreshing'] = False
+
+def _fetch_news(currencies, max_articles, etag=None):
+    """
+    Fetch economic news from NewsAPI without touching the cache.
+    
+    Args:
+        currencies (list): List of currency codes to get news for
+        max_articles (int): Maximum number of articles to return
+        etag (str): ETag of a previous response, sent as a conditional request
+        
+    Returns:
+        tuple: (articles, etag), where articles is a list of Article tuples,
+            NOT_MODIFIED if the previous response is still current, or None
+            if the request fails
+    """
     try:
         if NEWS_API_KEY:
-            # NewsAPI request
-            params = {
-                'q': query,
-                'from': (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d'),
-                'sortBy': 'publishedAt',
-                'language': 'en',
-                'apiKey': NEWS_API_KEY
-            }
-            
-            response = requests.get(NEWS_API_URL, params=params)
+            # The encoded URL only changes with the currency set and the date
+            date_from = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
+            page_size = min(max_articles, NEWS_API_PAGE_SIZE)
+            url = _build_request_url(frozenset(currencies), date_from, page_size)
             
-            if response.status_code == 200:
-                articles = response.json().get('articles', [])
-                # Format articles
-                results = [
-                    {
-                        'title': article['title'],
-                        'description': article['description'] or "No description available",
-                        'url': article['url'],
-                        'publishedAt': article['publishedAt'].split('T')[0],
-                        'source': article['source']['name']
-                    }
-                    for article in articles[:max_articles]
-                ]
+            articles = []
+            response_etag = None
+            page = 1
+            while len(articles) < max_articles:
+                # Only the first page is conditional; its ETag stands for the whole result
+                headers = {'If-None-Match': etag} if etag and page == 1 else None
+                response = _get_with_retry(f"{url}&page={page}", headers=headers)
                 
-                # Cache the results
-                news_cache[cache_key] = {
-                    'data': results,
-                    'timestamp': time.time()
-                }
+                if response.status_code == 304 and page == 1:
+                    return NOT_MODIFIED, etag
+                elif response.status_code != 200:
+                    logger.warning("Error fetching news: %s", response.status_code)
+                    if page == 1:
+                        return None, None
+                    # Keep the pages already fetched, but drop the ETag so a refresh
+                    # re-fetches the full result instead of revalidating the short one
+                    response_etag = None
+                    break
                 
-                return results
-            else:
-                print(f"Error fetching news: {response.status_code}")
-                return use_mock_news(currencies, max_articles)
+                data = orjson.loads(response.content)
+                page_articles = data.get('articles', [])
+                articles.extend(page_articles)
+                if page == 1:
+                    response_etag = response.headers.get('ETag')
+                
+                # Stop once the results run out
+                if len(page_articles) < page_size or len(articles) >= data.get('totalResults', 0):
+                    break
+                page += 1
+            
+            # Format articles; publishedAt is ISO 8601, so the date is its first 10 characters
+            return [
+                Article(
+                    article['title'],
+                    article.get('description') or "No description available",
+                    article['url'],
+                    article['publishedAt'][:10],
+                    article['source']['name']
+                )
+                for article in articles[:max_articles]
+            ], response_etag
         else:
-            print("No NEWS_API_KEY available")
-            return use_mock_news(currencies, max_articles)
+            logger.info("No NEWS_API_KEY available")
+            return None, None
             
-    except Exception as e:
-        print(f"Exception in get_economic_news: {e}")
-        return use_mock_news(currencies, max_articles)
+    except (httpx.HTTPError, ValueError, KeyError) as e:
+        logger.warning("Exception in get_economic_news: %s", e)
+        return None, None
+    except Exception:
+        logger.exception("Unexpected error fetching news")
+        raise
+
+def get_economic_news_batch(currency_batches, max_articles=10):
+    """
+    Fetch economic news for several currency sets concurrently.
+    
+    Args:
+        currency_batches (list): List of currency code lists, one per query
+        max_articles (int): Maximum number of articles to return per query
+        
+    Returns:
+        list: List of news article lists, in the same order as currency_batches
+    """
+    if not currency_batches:
+        return []
+    
+    with ThreadPoolExecutor(max_workers=min(8, len(currency_batches))) as executor:
+        return list(executor.map(lambda currencies: get_economic_news(currencies, max_articles), currency_batches))
 
 def use_mock_news(currencies, max_articles=10):
     """
@@ -115,96 +419,25 @@ def use_mock_news(currencies, max_articles=10):
         max_articles (int): Maximum number of articles to return
         
     Returns:
-        list: List of mock news articles
+        list: List of mock Article tuples
     """
+    # Format each date offset once
+    now = datetime.now()
+    day_strs = [(now - timedelta(days=offset)).strftime('%Y-%m-%d') for offset in range(MOCK_NEWS_MAX_DAY_OFFSET + 1)]
+    
+    # Add some currency-specific mock news after the general articles
+    templates = list(MOCK_NEWS)
+    templates.extend(MOCK_NEWS_BY_CURRENCY[currency] for currency in currencies if currency in MOCK_NEWS_BY_CURRENCY)
+    
     mock_articles = [
-        {
-            'title': 'Central Banks Signal Potential Interest Rate Changes',
-            'description': 'Central banks across major economies are signaling possible changes to interest rates in response to inflation trends, potentially affecting currency markets.',
-            'url': 'https://example.com/economic-news/1',
-            'publishedAt': datetime.now().strftime('%Y-%m-%d'),
-            'source': 'Economic Times'
-        },
-        {
-            'title': 'Global Inflation Concerns Impact Currency Markets',
-            'description': 'Rising inflation in major economies is causing volatility in forex markets as investors reassess currency valuations and central bank responses.',
-            'url': 'https://example.com/economic-news/2',
-            'publishedAt': (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d'),
-            'source': 'Financial Post'
-        },
-        {
-            'title': 'Trade Balance Data Shows Shifts in Economic Recovery',
-            'description': 'Recent trade balance figures indicate changing patterns in global economic recovery, with potential implications for currency strength in coming months.',
-            'url': 'https://example.com/economic-news/3',
-            'publishedAt': (datetime.now() - timedelta(days=2)).strftime('%Y-%m-%d'),
-            'source': 'World Economic Forum'
-        },
-        {
-            'title': 'Supply Chain Issues Continue to Affect Global Markets',
-            'description': 'Ongoing supply chain disruptions are impacting economic outlooks across regions, creating uncertainty in currency markets and trade relationships.',
-            'url': 'https://example.com/economic-news/4',
-            'publishedAt': (datetime.now() - timedelta(days=3)).strftime('%Y-%m-%d'),
-            'source': 'Business Insider'
-        },
-        {
-            'title': 'Economic Growth Forecasts Revised for Major Economies',
-            'description': 'International organizations have updated growth projections for key economies, potentially signaling shifts in relative currency strengths.',
-            'url': 'https://example.com/economic-news/5',
-            'publishedAt': (datetime.now() - timedelta(days=4)).strftime('%Y-%m-%d'),
-            'source': 'Reuters'
-        }
+        Article(
+            template['title'],
+            template['description'],
+            template['url'],
+            day_strs[template['day_offset']],
+            template['source']
+        )
+        for template in templates[:max_articles]
     ]
     
-    # Add some currency-specific mock news
-    for currency in currencies:
-        if currency == "USD":
-            mock_articles.append({
-                'title': 'US Dollar Strength Continues Amid Economic Data',
-                'description': 'The US Dollar maintains its position as economic indicators suggest resilience in the American economy despite global challenges.',
-                'url': 'https://example.com/economic-news/usd',
-                'publishedAt': (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d'),
-                'source': 'Wall Street Journal'
-            })
-        elif currency == "EUR":
-            mock_articles.append({
-                'title': 'European Central Bank Discusses Monetary Policy Direction',
-                'description': 'ECB officials are evaluating the economic outlook for the Eurozone and considering adjustments to monetary policy that could impact the Euro.',
-                'url': 'https://example.com/economic-news/eur',
-                'publishedAt': (datetime.now() - timedelta(days=2)).strftime('%Y-%m-%d'),
-                'source': 'Financial Times'
-            })
-        elif currency == "GBP":
-            mock_articles.append({
-                'title': 'Bank of England Responds to Inflation Pressures',
-                'description': 'The Bank of England is implementing measures to address rising inflation, with potential implications for the British Pound in international markets.',
-                'url': 'https://example.com/economic-news/gbp',
-                'publishedAt': datetime.now().strftime('%Y-%m-%d'),
-                'source': 'The Guardian'
-            })
-        elif currency == "JPY":
-            mock_articles.append({
-                'title': 'Bank of Japan Maintains Policy as Economy Shows Signs of Recovery',
-                'description': 'The Bank of Japan has decided to maintain its current monetary policy stance as economic indicators suggest a gradual recovery, influencing the Yen\'s position.',
-                'url': 'https://example.com/economic-news/jpy',
-                'publishedAt': (datetime.now() - timedelta(days=3)).strftime('%Y-%m-%d'),
-                'source': 'Nikkei Asia'
-            })
-        elif currency == "INR":
-            mock_articles.append({
-                'title': 'Indian Rupee Performance Linked to Economic Reforms',
-                'description': 'Recent economic reforms and policy decisions in India are influencing the performance of the Rupee against major global currencies.',
-                'url': 'https://example.com/economic-news/inr',
-                'publishedAt': (datetime.now() - timedelta(days=2)).strftime('%Y-%m-%d'),
-                'source': 'Economic Times India'
-            })
-        elif currency == "HUF":
-            mock_articles.append({
-                'title': 'Hungarian Forint Responds to Central Bank Monetary Decisions',
-                'description': 'The Hungarian National Bank\'s recent monetary policy decisions are affecting the Forint\'s exchange rate against major currencies.',
-                'url': 'https://example.com/economic-news/huf',
-                'publishedAt': (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d'),
-                'source': 'Budapest Business Journal'
-            })
-    
-    # Ensure we don't exceed max_articles
-    return mock_articles[:max_articles]
+    return mock_articles
@@ -1,12 +1,63 @@
 import pandas as pd
 import numpy as np
+import streamlit as st
 from prophet import Prophet
 from statsmodels.tsa.arima.model import ARIMA
+from cachetools import LRUCache
+from functools import lru_cache
+import hashlib
+import logging
+import threading
 import warnings
 
+logger = logging.getLogger(__name__)
+
 # Suppress warnings
 warnings.filterwarnings('ignore')
 
+# Fitted ARIMA parameters by series hash, used to warm-start repeat fits
+ARIMA_START_PARAMS_MAXSIZE = 64
+_arima_start_params = LRUCache(maxsize=ARIMA_START_PARAMS_MAXSIZE)
+# LRUCache is not thread-safe, and every session's script thread shares it
+_arima_start_params_lock = threading.Lock()
+
+@lru_cache(maxsize=32)
+def _fit_prophet(ds_bytes, y_bytes):
+    """
+    Fit a Prophet model, cached by the raw bytes of the training series.
+    
+    Only the fit is cached; predictions for any horizon reuse the fitted model.
+    
+    Args:
+        ds_bytes (bytes): Dates as datetime64[ns] values
+        y_bytes (bytes): Rates as float64 values
+        
+    Returns:
+        Prophet: The fitted model
+    """
+    historical_df = pd.DataFrame({
+        'ds': np.frombuffer(ds_bytes, dtype='datetime64[ns]'),
+        'y': np.frombuffer(y_bytes, dtype=np.float64)
+    })
+    
+    # Only fit seasonalities the history is long enough to estimate
+    n = len(historical_df)
+    
+    model = Prophet(
+        daily_seasonality=False,
+        weekly_seasonality=n >= 14,
+        yearly_seasonality=n >= 365,
+        changepoint_prior_scale=0.05,  # Flexibility of trend
+        seasonality_prior_scale=10.0,  # Strength of seasonality
+        changepoint_range=0.9,  # Percentage of history where trend changes can occur
+        uncertainty_samples=200,  # Enough for stable intervals; the default of 1000 dominates predict time
+        stan_backend="CMDSTANPY"
+    )
+    
+    model.fit(historical_df)
+    
+    return model
+
 def forecast_currency(historical_df, forecast_days=30):
     """
     Generate exchange rate forecasts using Facebook Prophet.
@@ -18,24 +69,18 @@ def forecast_currency(historical_df, forecast_days=30):
     Returns:
         pd.DataFrame: DataFrame containing the forecast
     """
+    # Check if we have enough data
+    if len(historical_df) < 10:
+        logger.info("Not enough historical data for reliable forecasting")
+        return fallback_forecast(historical_df, forecast_days)
+    
     try:
-        # Check if we have enough data
-        if len(historical_df) < 10:
-            print("Not enough historical data for reliable forecasting")
-            return fallback_forecast(historical_df, forecast_days)
-        
-        # Create and fit the Prophet model
-        model = Prophet(
-            daily_seasonality=False,
-            weekly_seasonality=True,
-            yearly_seasonality=True,
-            changepoint_prior_scale=0.05,  # Flexibility of trend
-            seasonality_prior_scale=10.0,  # Strength of seasonality
-            changepoint_range=0.9  # Percentage of history where trend changes can occur
+        # Fit the Prophet model, reusing a previous fit of the same series
+        model = _fit_prophet(
+            historical_df['ds'].to_numpy(dtype='datetime64[ns]').tobytes(),
+            historical_df['y'].to_numpy(dtype=np.float64).tobytes()
         )
         
-        model.fit(historical_df)
-        
         # Create future dataframe for predictions
         future = model.make_future_dataframe(periods=forecast_days)
         
@@ -43,62 +88,98 @@ def forecast_currency(historical_df, forecast_days=30):
         forecast = model.predict(future)
         
         return forecast
-    except Exception as e:
-        print(f"Prophet forecasting failed: {e}")
-        return fallback_forecast(historical_df, forecast_days)
+    except (RuntimeError, ValueError) as e:
+        logger.warning("Prophet forecasting failed: %s", e)
+    except Exception:
+        logger.exception("Unexpected error in Prophet forecasting")
+        raise
+    
+    # Outside the try, so errors fallback_forecast has already logged pass straight through
+    return fallback_forecast(historical_df, forecast_days)
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def cached_forecast(base_currency, target_currency, forecast_days, as_of_date, historical_rates):
+    """
+    Generate an exchange rate forecast, cached for 1 day.
+    
+    The key includes the currency pair and date so each model is trained
+    at most once per day, not on every Streamlit rerun.
+    
+    Args:
+        base_currency (str): The base currency code
+        target_currency (str): The target currency code
+        forecast_days (int): Number of days to forecast into the future
+        as_of_date (str): Date the forecast is made on, in YYYY-MM-DD format
+        historical_rates (tuple): Tuple of (date, rate) pairs used for training
+        
+    Returns:
+        pd.DataFrame: DataFrame containing the forecast
+    """
+    historical_df = pd.DataFrame({
+        'ds': pd.to_datetime([date_str for date_str, _ in historical_rates]),
+        'y': [rate for _, rate in historical_rates]
+    })
+    return forecast_currency(historical_df, forecast_days)
 
-def fallback_forecast(historical_df, forecast_days=30):
+def fallback_forecast(historical_df, forecast_days=30, with_intervals=True):
     """
     Fallback forecasting method using ARIMA model when Prophet fails.
     
     Args:
         historical_df (pd.DataFrame): DataFrame with 'ds' (dates) and 'y' (rates) columns
         forecast_days (int): Number of days to forecast into the future
+        with_intervals (bool): Whether to add 'yhat_lower' and 'yhat_upper' columns
         
     Returns:
         pd.DataFrame: DataFrame containing the forecast
     """
+    # ARIMA(2, 1, 0) cannot be estimated from fewer than 3 observations
+    if len(historical_df) < 3:
+        return simple_forecast(historical_df, forecast_days, with_intervals)
+    
     try:
         # Extract the time series
-        y = historical_df['y'].values
+        hist_y = historical_df['y'].to_numpy(dtype=np.float64)
+        series_key = hashlib.blake2b(hist_y.tobytes(), digest_size=8).digest()
         
-        # Simple ARIMA model
-        model = ARIMA(y, order=(5, 1, 0))
-        model_fit = model.fit()
+        with _arima_start_params_lock:
+            start_params = _arima_start_params.get(series_key)
+        
+        # Simple low-order ARIMA model; short FX series don't support more AR terms
+        model = ARIMA(hist_y, order=(2, 1, 0))
+        model_fit = model.fit(
+            start_params=start_params,
+            method='statespace',
+            low_memory=True,
+            cov_type='none'
+        )
         
         # Get forecast
         forecast_values = model_fit.forecast(steps=forecast_days)
         
-        # Create forecast dataframe
-        last_date = historical_df['ds'].iloc[-1]
-        future_dates = [last_date + pd.Timedelta(days=i+1) for i in range(forecast_days)]
+        # Series too short to estimate the model fit without error but forecast NaN
+        if not np.isfinite(forecast_values).all():
+            logger.warning("ARIMA forecast is not finite")
+            return simple_forecast(historical_df, forecast_days, with_intervals)
         
-        # Combine historical and forecast data
-        forecast_df = pd.DataFrame({
-            'ds': pd.concat([historical_df['ds'], pd.Series(future_dates)]),
-            'yhat': np.concatenate([historical_df['y'].values, forecast_values])
-        })
+        # Remember the fitted parameters to warm-start the next fit of this series
+        with _arima_start_params_lock:
+            _arima_start_params[series_key] = model_fit.params
         
         # Add uncertainty intervals (simple approach)
-        forecast_std = np.std(y) * np.sqrt(np.arange(1, len(forecast_values) + 1) / 10)
-        historical_std = np.zeros(len(historical_df))
-        
-        forecast_df['yhat_lower'] = np.concatenate([
-            historical_df['y'].values, 
-            forecast_values - 1.96 * forecast_std
-        ])
-        
-        forecast_df['yhat_upper'] = np.concatenate([
-            historical_df['y'].values, 
-            forecast_values + 1.96 * forecast_std
-        ])
-        
-        return forecast_df
-    except Exception as e:
-        print(f"ARIMA forecasting failed: {e}")
-        return simple_forecast(historical_df, forecast_days)
+        forecast_std = None
+        if with_intervals:
+            forecast_std = np.std(hist_y) * np.sqrt(np.arange(1, forecast_days + 1) / 10)
+        
+        return _assemble_forecast(historical_df, hist_y, forecast_values, forecast_std)
+    except (ValueError, np.linalg.LinAlgError) as e:
+        logger.warning("ARIMA forecasting failed: %s", e)
+        return simple_forecast(historical_df, forecast_days, with_intervals)
+    except Exception:
+        logger.exception("Unexpected error in ARIMA forecasting")
+        raise
 
-def simple_forecast(historical_df, forecast_days=30):
+def simple_forecast(historical_df, forecast_days=30, with_intervals=True):
     """
     Extremely simple forecasting as a last resort.
     Uses a simple moving average trend.
@@ -106,45 +187,73 @@ def simple_forecast(historical_df, forecast_days=30):
     Args:
         historical_df (pd.DataFrame): DataFrame with 'ds' (dates) and 'y' (rates) columns
         forecast_days (int): Number of days to forecast into the future
+        with_intervals (bool): Whether to add 'yhat_lower' and 'yhat_upper' columns
         
     Returns:
         pd.DataFrame: DataFrame containing the forecast
     """
+    hist_y = historical_df['y'].to_numpy()
+    
     # Get the last value
-    last_value = historical_df['y'].iloc[-1]
+    last_value = hist_y[-1]
     
     # Calculate trend from last 30 days (or less if not available)
-    window = min(30, len(historical_df) - 1)
+    window = min(30, len(hist_y) - 1)
     if window > 0:
-        trend = (last_value - historical_df['y'].iloc[-1-window]) / window
+        trend = (last_value - hist_y[-1-window]) / window
     else:
         trend = 0
     
-    # Create future dates
-    last_date = historical_df['ds'].iloc[-1]
-    future_dates = [last_date + pd.Timedelta(days=i+1) for i in range(forecast_days)]
-    
     # Generate forecast values with trend
-    forecast_values = [last_value + trend * (i+1) for i in range(forecast_days)]
-    
-    # Combine historical and forecast data
-    forecast_df = pd.DataFrame({
-        'ds': pd.concat([historical_df['ds'], pd.Series(future_dates)]),
-        'yhat': np.concatenate([historical_df['y'].values, forecast_values])
-    })
+    forecast_values = last_value + trend * np.arange(1, forecast_days + 1)
     
     # Add uncertainty intervals (increasing with time)
-    forecast_std = np.std(historical_df['y']) * np.sqrt(np.arange(1, len(forecast_values) + 1) / 5)
-    historical_std = np.zeros(len(historical_df))
+    forecast_std = None
+    if with_intervals:
+        forecast_std = np.std(hist_y) * np.sqrt(np.arange(1, forecast_days + 1) / 5)
     
-    forecast_df['yhat_lower'] = np.concatenate([
-        historical_df['y'].values, 
-        forecast_values - 1.96 * forecast_std
-    ])
+    return _assemble_forecast(historical_df, hist_y, forecast_values, forecast_std)
+
+def _assemble_forecast(historical_df, hist_y, forecast_values, forecast_std=None):
+    """
+    Combine historical and forecast values into a single forecast DataFrame.
     
-    forecast_df['yhat_upper'] = np.concatenate([
-        historical_df['y'].values, 
-        forecast_values + 1.96 * forecast_std
-    ])
+    Each output column is preallocated once and filled in place, so the
+    historical values are copied only once per column.
+    
+    Args:
+        historical_df (pd.DataFrame): DataFrame with 'ds' (dates) and 'y' (rates) columns
+        hist_y (np.ndarray): Historical rates
+        forecast_values (np.ndarray): Forecast rates, one per future day
+        forecast_std (np.ndarray): Forecast standard deviations, or None to skip intervals
+        
+    Returns:
+        pd.DataFrame: DataFrame with 'ds' and 'yhat' columns, plus 'yhat_lower'
+            and 'yhat_upper' when forecast_std is given
+    """
+    n_hist = len(hist_y)
+    n = n_hist + len(forecast_values)
+    
+    # Future dates continue daily from the last historical date
+    ds = np.empty(n, dtype='datetime64[ns]')
+    ds[:n_hist] = historical_df['ds'].to_numpy(dtype='datetime64[ns]')
+    ds[n_hist:] = ds[n_hist - 1] + np.arange(1, len(forecast_values) + 1) * np.timedelta64(1, 'D')
+    
+    yhat = np.empty(n)
+    yhat[:n_hist] = hist_y
+    yhat[n_hist:] = forecast_values
+    columns = {'ds': ds, 'yhat': yhat}
+    
+    if forecast_std is not None:
+        yhat_lower = np.empty(n)
+        yhat_lower[:n_hist] = hist_y
+        yhat_lower[n_hist:] = forecast_values - 1.96 * forecast_std
+        
+        yhat_upper = np.empty(n)
+        yhat_upper[:n_hist] = hist_y
+        yhat_upper[n_hist:] = forecast_values + 1.96 * forecast_std
+        
+        columns['yhat_lower'] = yhat_lower
+        columns['yhat_upper'] = yhat_upper
     
-    return forecast_df
+    return pd.DataFrame(columns)
@@ -1,6 +1,43 @@
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 from datetime import datetime
-from currency_api import get_exchange_rates, get_historical_rates
+from functools import lru_cache
+import logging
+from currency_api import get_exchange_rates, get_single_rate
+
+logger = logging.getLogger(__name__)
+
+# Common currencies
+CURRENCY_LIST = (
+    "USD", "EUR", "GBP", "JPY", "CAD", "AUD", "CHF", "CNY",
+    "HKD", "NZD", "SEK", "NOK", "SGD", "MXN", "INR", "BRL",
+    "ZAR", "RUB", "TRY", "HUF", "PLN"
+)
+
+CURRENCY_FULL_NAMES = {
+    "USD": "United States Dollar",
+    "EUR": "Euro",
+    "GBP": "British Pound Sterling",
+    "JPY": "Japanese Yen",
+    "CAD": "Canadian Dollar",
+    "AUD": "Australian Dollar",
+    "CHF": "Swiss Franc",
+    "CNY": "Chinese Yuan",
+    "HKD": "Hong Kong Dollar",
+    "NZD": "New Zealand Dollar",
+    "SEK": "Swedish Krona",
+    "NOK": "Norwegian Krone",
+    "SGD": "Singapore Dollar",
+    "MXN": "Mexican Peso",
+    "INR": "Indian Rupee",
+    "BRL": "Brazilian Real",
+    "ZAR": "South African Rand",
+    "RUB": "Russian Ruble",
+    "TRY": "Turkish Lira",
+    "HUF": "Hungarian Forint",
+    "PLN": "Polish Złoty"
+}
 
 def calculate_gain_loss(base_currency, target_currency, amount, past_date, current_date):
     """
@@ -18,24 +55,19 @@ def calculate_gain_loss(base_currency, target_currency, amount, past_date, curre
             or None if calculation fails
     """
     try:
-        # Get historical rate for the past date
-        historical_rates = get_historical_rates(
-            base_currency,
-            target_currency,
-            past_date,
-            past_date
-        )
+        # Fetch the past and current rates concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            past_rate_future = executor.submit(get_single_rate, base_currency, target_currency, past_date)
+            current_rates_future = executor.submit(get_exchange_rates, base_currency)
+            past_rate = past_rate_future.result()
+            current_rates = current_rates_future.result()
         
-        if not historical_rates or past_date not in historical_rates:
-            print(f"Historical rate not available for {past_date}")
+        if past_rate is None:
+            logger.warning("Historical rate not available for %s", past_date)
             return None
-            
-        past_rate = historical_rates[past_date]
         
-        # Get current exchange rate
-        current_rates = get_exchange_rates(base_currency)
         if not current_rates or target_currency not in current_rates:
-            print(f"Current rate not available for {target_currency}")
+            logger.warning("Current rate not available for %s", target_currency)
             return None
             
         current_rate = current_rates[target_currency]
@@ -49,23 +81,79 @@ def calculate_gain_loss(base_currency, target_currency, amount, past_date, curre
         
         return (past_rate, current_rate, past_value, current_value, absolute_change, percentage_change)
     
-    except Exception as e:
-        print(f"Exception in calculate_gain_loss: {e}")
+    except (ValueError, ZeroDivisionError) as e:
+        logger.warning("Exception in calculate_gain_loss: %s", e)
         return None
+    except Exception:
+        logger.exception("Unexpected error in calculate_gain_loss")
+        raise
+
+def downsample_lttb(x, y, n_out=500):
+    """
+    Select the points that best preserve a series' shape using the
+    Largest-Triangle-Three-Buckets (LTTB) algorithm.
+    
+    Args:
+        x (np.ndarray): Numeric x values (e.g., dates as integers), ascending
+        y (np.ndarray): Values of the series
+        n_out (int): Maximum number of points to keep
+        
+    Returns:
+        np.ndarray: Indices of the selected points, in ascending order
+    """
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    
+    # The first and last points are always kept; the rest are split into buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        
+        # Average of the next bucket is the third vertex of the triangle
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        
+        # Keep the point forming the largest triangle with the previous pick
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    
+    return selected
 
 def get_currency_list():
     """
     Get a list of supported currencies.
     
     Returns:
-        list: List of currency codes
+        tuple: Tuple of currency codes
+    """
+    return CURRENCY_LIST
+
+@lru_cache(maxsize=None)
+def get_target_currencies(base_currency):
+    """
+    Get the supported currencies that can be tracked against a base currency.
+    
+    Args:
+        base_currency (str): The base currency code
+        
+    Returns:
+        tuple: Tuple of currency codes, excluding the base currency
     """
-    # Common currencies
-    return [
-        "USD", "EUR", "GBP", "JPY", "CAD", "AUD", "CHF", "CNY", 
-        "HKD", "NZD", "SEK", "NOK", "SGD", "MXN", "INR", "BRL", 
-        "ZAR", "RUB", "TRY", "HUF", "PLN"
-    ]
+    return tuple(curr for curr in CURRENCY_LIST if curr != base_currency)
 
 def get_currency_full_names():
     """
@@ -74,26 +162,4 @@ def get_currency_full_names():
     Returns:
         dict: Dictionary mapping currency codes to full names
     """
-    return {
-        "USD": "United States Dollar",
-        "EUR": "Euro",
-        "GBP": "British Pound Sterling",
-        "JPY": "Japanese Yen",
-        "CAD": "Canadian Dollar",
-        "AUD": "Australian Dollar",
-        "CHF": "Swiss Franc",
-        "CNY": "Chinese Yuan",
-        "HKD": "Hong Kong Dollar",
-        "NZD": "New Zealand Dollar",
-        "SEK": "Swedish Krona",
-        "NOK": "Norwegian Krone",
-        "SGD": "Singapore Dollar",
-        "MXN": "Mexican Peso",
-        "INR": "Indian Rupee",
-        "BRL": "Brazilian Real",
-        "ZAR": "South African Rand",
-        "RUB": "Russian Ruble",
-        "TRY": "Turkish Lira",
-        "HUF": "Hungarian Forint",
-        "PLN": "Polish Złoty"
-    }
+    return CURRENCY_FULL_NAMES